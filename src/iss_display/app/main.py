@@ -419,10 +419,10 @@ class HudComposer(threading.Thread):
             if telemetry is None:
                 continue
             try:
-                top_b, bot_b, key = self._lcd.render_hud_into(
+                top_px, bot_px, key = self._lcd.render_hud_into(
                     telemetry, self._top_img, self._bot_img,
                 )
-                self._lcd.apply_hud_bytes(top_b, bot_b, key)
+                self._lcd.apply_hud_pixels(top_px, bot_px, key)
             except Exception:
                 logger.exception("HudComposer render failed; will retry next tick")
 
@@ -513,7 +513,6 @@ class DisplayRenderer(threading.Thread):
 
     def run(self):
         lcd = self._lcd
-        frame_period = lcd._rotation_period / lcd.num_frames
 
         while self._running:
             try:
@@ -521,7 +520,7 @@ class DisplayRenderer(threading.Thread):
                     active_view = self._active_view
 
                 if active_view == ViewToggle.ISS_VIEW:
-                    self._run_iss_frame(lcd, frame_period)
+                    self._run_iss_frame(lcd)
                 else:
                     self._run_crew_frame(lcd)
             except (SystemExit, KeyboardInterrupt):
@@ -538,21 +537,19 @@ class DisplayRenderer(threading.Thread):
                 # during long error loops.
                 self.heartbeat = time.monotonic()
 
-    def _run_iss_frame(self, lcd, frame_period):
+    def _run_iss_frame(self, lcd):
         """Render one ISS globe frame with precise timing."""
         # Wait for the next globe frame boundary using hybrid sleep:
         # coarse time.sleep() for most of the wait, then busy-wait
         # for the final ms to get sub-ms precision on the Pi 3.
-        now = time.time()
-        elapsed = now - lcd._rotation_start_time
-        time_in_frame = elapsed % frame_period
-        time_to_next = frame_period - time_in_frame
+        now_ns = time.monotonic_ns()
+        ns_to_next = lcd.ns_until_next_frame(now_ns)
 
-        if time_to_next > 0.004:
-            time.sleep(time_to_next - 0.002)
+        if ns_to_next > 4_000_000:
+            time.sleep((ns_to_next - 2_000_000) / 1e9)
 
-        target = now + time_to_next
-        while time.time() < target:
+        target_ns = now_ns + ns_to_next
+        while time.monotonic_ns() < target_ns:
             pass  # busy-wait for precise frame alignment
 
         # Read latest telemetry (brief lock)
@@ -673,13 +670,13 @@ def run_loop(settings: Settings) -> None:
         hud_composer.set_telemetry(telemetry)
 
         # Synchronous initial HUD render so the first frame on the display
-        # has correct HUD bytes — the render thread starts immediately and
+        # has correct HUD pixels — the render thread starts immediately and
         # the composer's first scheduled wakeup is up to a full interval away.
         try:
-            top_b, bot_b, key = driver.render_hud_into(
+            top_px, bot_px, key = driver.render_hud_into(
                 telemetry, driver._hud_top_img, driver._hud_bot_img,
             )
-            driver.apply_hud_bytes(top_b, bot_b, key)
+            driver.apply_hud_pixels(top_px, bot_px, key)
         except Exception:
             logger.exception("Initial HUD render failed; first frames may show blank HUD")
 
@@ -1,5 +1,9 @@
+import functools
 import logging
 import math
+import os
+import queue
+import struct
 import threading
 import time
 from dataclasses import dataclass
@@ -42,13 +46,25 @@ COLMOD  = 0x3A
 # Recovery constants
 _MAX_RECOVERY_ATTEMPTS = 3
 
+# spidev kernel module's per-transfer buffer size (module parameter)
+_SPIDEV_BUFSIZ_PATH = Path("/sys/module/spidev/parameters/bufsiz")
+
 # Frame index resync threshold: snap to wall-clock if we've fallen this many
 # frames behind. Below the threshold, we advance one frame per render to
 # eliminate visible angular jumps under transient stalls.
 _FRAME_RESYNC_THRESHOLD = 4
 
+# ISS marker opacity is quantized to this many steps above zero; each level's
+# sprite is rasterised once and reused. Fine enough that the limb fade
+# doesn't visibly step.
+_MARKER_OPACITY_LEVELS = 32
+
 RGB = Tuple[int, int, int]
 
+# CASET/RASET payload: start and end address as two big-endian u16 values.
+# Bound once so set_window() does a single C-level store per window command.
+_pack_window = struct.Struct('>HH').pack_into
+
 
 @dataclass
 class _ResolvedText:
@@ -73,6 +89,86 @@ def _rgb_to_rgb565(r: int, g: int, b: int) -> int:
     return val
 
 
+def _rgb_to_rgb565_array(r: np.ndarray, g: np.ndarray, b: np.ndarray,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Vectorised _rgb_to_rgb565 over same-shaped channel arrays.
+
+    Returns native uint16, or writes into ``out`` (any uint16 byte order,
+    e.g. a '>u2' frame) so the caller gets display-ready pixels without a
+    separate byte-swapping copy. Shifts and masks run in place on the three
+    widened channels; no other full-size temporaries are allocated.
+    """
+    r = r.astype(np.uint16)
+    g = g.astype(np.uint16)
+    b = b.astype(np.uint16)
+    r &= 0xF8
+    r <<= 8
+    g &= 0xFC
+    g <<= 3
+    b >>= 3
+    r |= g
+    return np.bitwise_or(r, b, out=out)
+
+
+@functools.lru_cache(maxsize=1)
+def _rgb565_to_rgb888_lut() -> np.ndarray:
+    """(65536, 3) uint8 table expanding every RGB565 value to RGB888.
+
+    Channels are widened by bit replication ((r5 << 3) | (r5 >> 2) etc.) so
+    full-scale 565 values map to 255, not 248/252. Built on first use.
+    """
+    v = np.arange(65536, dtype=np.uint16)
+    r5 = (v >> 11).astype(np.uint8)
+    g6 = ((v >> 5) & 0x3F).astype(np.uint8)
+    b5 = (v & 0x1F).astype(np.uint8)
+    return np.stack([(r5 << 3) | (r5 >> 2), (g6 << 2) | (g6 >> 4), (b5 << 3) | (b5 >> 2)], axis=-1)
+
+
+@functools.lru_cache(maxsize=1)
+def _natural_earth_features(ocean: RGB, land: RGB, land_border: RGB, land_border_width: float,
+                            coastline: RGB, coastline_width: float) -> tuple:
+    """Build the styled 110m ocean/land/coastline features, once per process.
+
+    Globe workers render many frames each; sharing the feature objects means
+    styling is resolved once and every frame draws the same in-memory
+    Natural Earth geometries. Returned in zorder (draw) order.
+    """
+    import cartopy.feature as cfeature
+
+    return (
+        cfeature.NaturalEarthFeature(
+            'physical', 'ocean', '110m',
+            facecolor=rgb_to_hex(ocean), edgecolor='none'),
+        cfeature.NaturalEarthFeature(
+            'physical', 'land', '110m',
+            facecolor=rgb_to_hex(land),
+            edgecolor=rgb_to_hex(land_border),
+            linewidth=land_border_width),
+        cfeature.NaturalEarthFeature(
+            'physical', 'coastline', '110m',
+            facecolor='none',
+            edgecolor=rgb_to_hex(coastline),
+            linewidth=coastline_width),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _globe_figure(globe_size: int, facecolor: str):
+    """Return this process's reusable Agg figure for globe frames.
+
+    Created once per worker and cleared between frames instead of building
+    and tearing down a pyplot figure (and its canvas/renderer) per frame.
+    Bypasses pyplot entirely, so nothing is registered for plt.close().
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    dpi = 100
+    fig = Figure(figsize=(globe_size / dpi, globe_size / dpi), dpi=dpi, facecolor=facecolor)
+    FigureCanvasAgg(fig)
+    return fig
+
+
 class ST7796S:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -98,6 +194,7 @@ class ST7796S:
 
         self._init_gpio()
         self._init_spi()
+        self._check_spi_bufsiz()
         self._init_display(first_boot=True)
 
     def _init_gpio(self):
@@ -117,6 +214,27 @@ class ST7796S:
                      f"device={self.settings.spi_device}, "
                      f"speed={self.settings.spi_speed_hz / 1_000_000:.1f} MHz")
 
+    def _check_spi_bufsiz(self):
+        """Warn if the spidev buffer can't take a full frame in one transfer.
+
+        writebytes2 splits each write into spidev-bufsiz-sized ioctls on its
+        own, so a small buffer still works — just as ~75 transfers per full
+        frame at the 4 KB default instead of one. Raise it with
+        'options spidev bufsiz=307200' in /etc/modprobe.d/spidev.conf.
+        """
+        frame_bytes = self.width * self.height * 2
+        try:
+            bufsiz = int(_SPIDEV_BUFSIZ_PATH.read_text())
+        except (OSError, ValueError):
+            logger.debug("spidev bufsiz not readable at %s", _SPIDEV_BUFSIZ_PATH)
+            return
+        if bufsiz < frame_bytes:
+            logger.warning("spidev bufsiz is %d bytes (< %d-byte frame); "
+                           "full frames will be split into %d SPI transfers",
+                           bufsiz, frame_bytes, -(-frame_bytes // bufsiz))
+        else:
+            logger.info("spidev bufsiz: %d bytes", bufsiz)
+
     def _reset(self):
         GPIO.output(self.rst, GPIO.HIGH)
         time.sleep(0.02)
@@ -206,10 +324,10 @@ class ST7796S:
     def _fill(self, color: int):
         """Fill the entire screen with a solid color (RGB565)."""
         self.set_window(0, 0, self.width - 1, self.height - 1)
-        high = (color >> 8) & 0xFF
-        low = color & 0xFF
-        pixel_data = bytes([high, low] * (self.width * self.height))
-        logger.info(f"_fill: color=0x{color:04X}, {len(pixel_data)} bytes, "
+        # Big-endian uint16 fill: one C-level memset-style pass, handed to
+        # writebytes2 through the buffer protocol without a bytes() copy.
+        pixel_data = np.full(self.width * self.height, color, dtype='>u2')
+        logger.info(f"_fill: color=0x{color:04X}, {pixel_data.nbytes} bytes, "
                     f"DC pin will be set HIGH")
         GPIO.output(self.dc, GPIO.HIGH)
         self.spi.writebytes2(pixel_data)
@@ -222,7 +340,7 @@ class ST7796S:
         self.spi.writebytes2(self._cmd_buf)
         GPIO.output(self.dc, GPIO.HIGH)
         d = self._caset_data
-        d[0] = x0 >> 8; d[1] = x0 & 0xFF; d[2] = x1 >> 8; d[3] = x1 & 0xFF
+        _pack_window(d, 0, x0, x1)
         self.spi.writebytes2(d)
 
         # RASET
@@ -231,7 +349,7 @@ class ST7796S:
         self.spi.writebytes2(self._cmd_buf)
         GPIO.output(self.dc, GPIO.HIGH)
         d = self._raset_data
-        d[0] = y0 >> 8; d[1] = y0 & 0xFF; d[2] = y1 >> 8; d[3] = y1 & 0xFF
+        _pack_window(d, 0, y0, y1)
         self.spi.writebytes2(d)
 
         # RAMWR
@@ -255,13 +373,17 @@ class ST7796S:
         """Send a rectangular sub-region from frame_buf_np to the display.
 
         Used for partial updates (ISS marker erase/redraw) to avoid sending
-        the full 307 KB frame when only a small area changed.
+        the full 307 KB frame when only a small area changed. Full-width
+        regions (the HUD bars) are already one contiguous run of rows in
+        frame_buf_np and are sent as a view, with no copy at all; narrower
+        regions are packed into one contiguous array (a no-op for
+        contiguous input) and that array goes to writebytes2 directly.
         """
-        region_bytes = np.ascontiguousarray(frame_buf_np[y0:y1 + 1, x0:x1 + 1]).tobytes()
+        region = np.ascontiguousarray(frame_buf_np[y0:y1 + 1, x0:x1 + 1])
         try:
             self.set_window(x0, y0, x1, y1)
             GPIO.output(self.dc, GPIO.HIGH)
-            self.spi.writebytes2(region_bytes)
+            self.spi.writebytes2(region)
             self._consecutive_failures = 0
         except Exception as e:
             self._consecutive_failures += 1
@@ -278,10 +400,7 @@ class ST7796S:
 
         # Clear screen (single fill, IPS panels don't ghost)
         try:
-            black_screen = bytes(self.width * self.height * 2)
-            self.set_window(0, 0, self.width - 1, self.height - 1)
-            GPIO.output(self.dc, GPIO.HIGH)
-            self.spi.writebytes2(black_screen)
+            self._fill(0x0000)
             time.sleep(0.05)
         except Exception:
             logger.debug("Screen clear during shutdown failed", exc_info=True)
@@ -358,15 +477,27 @@ class LcdDisplay:
             gx0, gy0, gx0 + globe_size - 1, gy0 + globe_size - 1,
         )
 
-        # Pre-rendered frame caches
-        self.frame_cache: List[Image.Image] = []
-        self.frame_bytes_cache: List[bytes] = []
+        # Pre-rendered globe frames, packed RGB565 (num_frames, height, width)
+        self.frame_np_cache: np.ndarray = np.empty((0, self.height, self.width), dtype='>u2')
         self.num_frames = THEME.globe.num_frames
         self.frames_generated = False
 
+        # Per-frame central-longitude trig and the (constant) horizon cutoff,
+        # so _calc_iss_screen_pos only does table lookups for the globe side.
+        frame_lon_rad = np.radians(np.arange(self.num_frames) * (360.0 / self.num_frames) - 180.0)
+        self._frame_cos_cl: List[float] = np.cos(frame_lon_rad).tolist()
+        self._frame_sin_cl: List[float] = np.sin(frame_lon_rad).tolist()
+        self._horizon_threshold = -math.sqrt(1 - 1 / (self.iss_orbit_scale ** 2))
+        # (lat, lon) → (cos_lat, sin_lat, cos_lon, sin_lon); telemetry changes
+        # far less often than frames render.
+        self._iss_trig_key: Optional[Tuple[float, float]] = None
+        self._iss_trig: Tuple[float, float, float, float] = (1.0, 0.0, 1.0, 0.0)
+
         # Time-based rotation (decouples speed from frame count)
-        self._rotation_start_time: float = time.time()
-        self._rotation_period: float = THEME.globe.rotation_period_sec
+        # Integer nanoseconds on the monotonic clock: immune to NTP steps and
+        # keeps the frame index exact however long the process has been up.
+        self._rotation_start_ns: int = time.monotonic_ns()
+        self._rotation_period_ns: int = int(THEME.globe.rotation_period_sec * 1e9)
 
         # Cache directory
         self.cache_dir = self.settings.preview_dir.parent / "frame_cache"
@@ -374,7 +505,6 @@ class LcdDisplay:
 
         # Load or generate globe frames
         self._load_or_generate_frames()
-        self._precompute_rgb565()
 
         # Reusable frame buffer — avoids per-frame allocation
         self._frame_buf = bytearray(self.width * self.height * 2)
@@ -385,6 +515,7 @@ class LcdDisplay:
         # Partial-update state
         self._prev_frame_idx: Optional[int] = None
         self._prev_marker_bbox: Optional[Tuple[int, int, int, int]] = None  # (x0, y0, x1, y1)
+        self._prev_iss_pos: Optional[Tuple[int, int, float]] = None  # (px, py, opacity)
         self._force_full_frame: bool = True  # first frame is always a full write
 
         # Tracks which HUD-bar version was most recently transmitted to the
@@ -393,17 +524,8 @@ class LcdDisplay:
         self._last_sent_top_version: int = 0
         self._last_sent_bottom_version: int = 0
 
-        # Pre-allocated marker drawing buffers (avoids per-frame numpy allocations)
-        m = THEME.marker
-        max_marker_r = int(m.outer_ring_radius * m.max_size_scale) + 1
-        max_marker_dim = 2 * max_marker_r + 1
-        # Pre-compute full distance-squared grid centered at origin (used via slicing)
-        _dy = np.arange(-max_marker_r, max_marker_r + 1, dtype=np.int32)
-        _dx = np.arange(-max_marker_r, max_marker_r + 1, dtype=np.int32)
-        self._marker_dist_sq_full = _dy[:, None] ** 2 + _dx[None, :] ** 2
-        self._marker_max_r = max_marker_r
-        self._marker_color_buf = np.zeros((max_marker_dim, max_marker_dim), dtype=np.uint16)
-        self._marker_mask = np.zeros((max_marker_dim, max_marker_dim), dtype=np.bool_)
+        # Marker rasterisation caches (avoid per-frame numpy allocations)
+        self._init_marker()
 
         # HUD setup
         self._init_hud()
@@ -414,6 +536,16 @@ class LcdDisplay:
         # Preview frame counter
         self._preview_frame_count = 0
 
+        # Preview PNGs are encoded on a writer thread so zlib never runs on
+        # the render path. Bounded queue: when the writer falls behind, new
+        # previews are dropped rather than stalling the renderer.
+        self._preview_queue: "queue.Queue[Optional[Tuple[np.ndarray, int]]]" = queue.Queue(maxsize=2)
+        self._preview_thread: Optional[threading.Thread] = None
+        if self.driver is None:
+            self._preview_thread = threading.Thread(
+                target=self._preview_worker, daemon=True, name="preview-writer")
+            self._preview_thread.start()
+
     def reinit(self):
         """Re-initialize the display hardware (called by render thread on persistent errors)."""
         if self.driver:
@@ -512,14 +644,20 @@ class LcdDisplay:
         self._hud_top_border = resolve_border_color(hud.top, hud)
         self._hud_bot_border = resolve_border_color(hud.bottom, hud)
 
-        # Cached HUD bytes: produced off-thread by HudComposer, consumed by the
-        # render thread. The lock guards atomic-swap of bytes + version counters.
+        # Row ranges of each HUD bar within _frame_buf_np (fixed for the
+        # lifetime of the display), so patching is a single block copy.
+        self._hud_top_rows = slice(0, self._hud_top_height)
+        self._hud_bot_rows = slice(self.height - self._hud_bot_height, self.height)
+
+        # Cached HUD pixels (read-only big-endian RGB565 arrays, one per bar):
+        # produced off-thread by HudComposer, consumed by the render thread.
+        # The lock guards atomic-swap of pixels + version counters.
         # Per-bar versions let the render thread send only the bars that changed
         # (split-SPI-transfer strategy: ~5 ms per HUD bar vs ~51 ms full-frame).
         self._hud_lock = threading.Lock()
         self._hud_cache_key: Optional[str] = None
-        self._hud_top_bytes: Optional[bytes] = None
-        self._hud_bottom_bytes: Optional[bytes] = None
+        self._hud_top_px: Optional[np.ndarray] = None
+        self._hud_bottom_px: Optional[np.ndarray] = None
         self._hud_top_version: int = 0
         self._hud_bottom_version: int = 0
 
@@ -533,6 +671,51 @@ class LcdDisplay:
         self._hud_top_img = Image.new('RGB', (self.width, self._hud_top_height), self._hud_bg)
         self._hud_bot_img = Image.new('RGB', (self.width, self._hud_bot_height), self._hud_bg)
 
+        # Region name -> [(x, word), ...] with x relative to the right edge.
+        # Filled lazily by whichever thread renders the HUD: the main thread
+        # for the initial render in run_loop, then the HudComposer. Access is
+        # serialized because the composer is only started after that render.
+        self._region_layouts: dict[str, list[tuple[int, str]]] = {}
+
+        self._render_hud_plates()
+
+    def _render_hud_plates(self):
+        """Pre-render the static part of each HUD bar: background, border, labels.
+
+        The labels never change, so render_hud_into starts every redraw by
+        pasting these plates and only rasterises the live values. Read-only
+        after init, so the HudComposer thread can paste from them freely.
+        """
+        w = self.width
+        g = self._hud_grid
+        label_y = self._hud_label_y
+        right_edge = w - g
+
+        top = Image.new('RGB', (w, self._hud_top_height), self._hud_bg)
+        draw = ImageDraw.Draw(top)
+        draw.line([0, self._hud_top_height - 1, w, self._hud_top_height - 1], fill=self._hud_top_border)
+        lat_el = self._resolved["lat"]
+        lon_el = self._resolved["lon"]
+        over_el = self._resolved["over"]
+        draw.text((g, label_y), "LAT", fill=lat_el.label.color, font=lat_el.label.font)
+        draw.text((g + lat_el.cell_width + g, label_y), "LON", fill=lon_el.label.color, font=lon_el.label.font)
+        over_label_w = draw.textbbox((0, 0), "OVER", font=over_el.label.font)[2]
+        draw.text((right_edge - over_label_w, label_y), "OVER", fill=over_el.label.color, font=over_el.label.font)
+
+        bot = Image.new('RGB', (w, self._hud_bot_height), self._hud_bg)
+        draw = ImageDraw.Draw(bot)
+        draw.line([0, 0, w, 0], fill=self._hud_bot_border)
+        alt_el = self._resolved["alt"]
+        vel_el = self._resolved["vel"]
+        age_el = self._resolved["age"]
+        draw.text((g, label_y), "ALT", fill=alt_el.label.color, font=alt_el.label.font)
+        draw.text((g + alt_el.cell_width + g, label_y), "VEL", fill=vel_el.label.color, font=vel_el.label.font)
+        age_label_w = draw.textbbox((0, 0), "LAST", font=age_el.label.font)[2]
+        draw.text((right_edge - age_label_w, label_y), "LAST", fill=age_el.label.color, font=age_el.label.font)
+
+        self._hud_top_plate = top
+        self._hud_bot_plate = bot
+
     def _get_font(self, font_path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
         """Load a font at a given size, using the cache."""
         path = font_path or self._default_font_path
@@ -543,15 +726,45 @@ class LcdDisplay:
             self._font_cache[key] = ImageFont.truetype(path, size)
         return self._font_cache[key]
 
-    def render_hud_into(self, telemetry: "ISSFix",
-                        top_img: Image.Image, bot_img: Image.Image) -> Tuple[bytes, bytes, str]:
-        """Render the HUD bars into the given image buffers and return RGB565 bytes.
+    def _region_layout(self, region: str, draw: ImageDraw.ImageDraw) -> list[tuple[int, str]]:
+        """Return the right-aligned word placement for a region name.
 
-        Pure-ish: only writes to the passed images. Does not mutate any LcdDisplay
-        state, so it is safe to call from the HudComposer thread with its own
-        scratch buffers while the render thread reads the committed bytes.
+        There are only a dozen region names, so each is measured once and
+        reused instead of re-running textbbox on every HUD redraw.
+        """
+        layout = self._region_layouts.get(region)
+        if layout is not None:
+            return layout
+        font = self._resolved["over"].value.font
+        # Render multi-word regions with a tighter gap than the mono font's
+        # full-width space (e.g. "N. America" → "N." + small gap + "America").
+        words = region.split(" ")
+        tight_gap = 0
+        if len(words) > 1:
+            space_w = draw.textbbox((0, 0), " ", font=font)[2]
+            tight_gap = max(1, space_w // 3)
+        word_widths = [draw.textbbox((0, 0), w_, font=font)[2] for w_ in words]
+        x = -(sum(word_widths) + tight_gap * (len(words) - 1))
+        layout = []
+        for word, word_w in zip(words, word_widths):
+            layout.append((x, word))
+            x += word_w + tight_gap
+        self._region_layouts[region] = layout
+        return layout
 
-        Returns (top_bytes, bottom_bytes, cache_key).
+    def render_hud_into(self, telemetry: "ISSFix",
+                        top_img: Image.Image, bot_img: Image.Image) -> Tuple[np.ndarray, np.ndarray, str]:
+        """Render the HUD bars into the given image buffers and return RGB565 pixels.
+
+        Writes to the passed images and fills the _region_layouts cache (via
+        _region_layout); it never touches the committed HUD pixels or the
+        frame buffer, so the render thread can keep sending while it runs.
+        It is not re-entrant: the cache is unlocked, which is only safe
+        because run_loop makes its first call on the main thread before
+        hud_composer.start(), and after that the composer is the sole caller.
+
+        Returns (top_px, bottom_px, cache_key), where top_px and bottom_px are
+        read-only (bar_height, width) big-endian uint16 arrays.
         """
         lat = telemetry.latitude
         lon = telemetry.longitude
@@ -571,59 +784,36 @@ class LcdDisplay:
 
         w = self.width
         g = self._hud_grid
-        top_h = self._hud_top_height
-        bot_h = self._hud_bot_height
-        label_y = self._hud_label_y
         value_y = self._hud_value_y
 
-        # ── Top bar — clear before drawing into the caller-provided buffer ──
+        # ── Top bar — reset the caller-provided buffer to the static plate ──
+        top_img.paste(self._hud_top_plate)
         draw = ImageDraw.Draw(top_img)
-        draw.rectangle([0, 0, w, top_h], fill=self._hud_bg)
-        draw.line([0, top_h - 1, w, top_h - 1], fill=self._hud_top_border)
 
         # LAT cell
         lat_el = self._resolved["lat"]
         lat_x = g
-        draw.text((lat_x, label_y), "LAT", fill=lat_el.label.color, font=lat_el.label.font)
         draw.text((lat_x, value_y), lat_val, fill=lat_el.value.color, font=lat_el.value.font)
 
         # LON cell
         lon_el = self._resolved["lon"]
         lon_x = lat_x + lat_el.cell_width + g
-        draw.text((lon_x, label_y), "LON", fill=lon_el.label.color, font=lon_el.label.font)
         draw.text((lon_x, value_y), lon_val, fill=lon_el.value.color, font=lon_el.value.font)
 
         # Region indicator (right-aligned)
         over_el = self._resolved["over"]
         region = get_common_area_name(lat, lon)
         right_edge = w - g
-        over_label_w = draw.textbbox((0, 0), "OVER", font=over_el.label.font)[2]
-        draw.text((right_edge - over_label_w, label_y), "OVER", fill=over_el.label.color, font=over_el.label.font)
-        # Render multi-word regions with a tighter gap than the mono font's
-        # full-width space (e.g. "N. America" → "N." + small gap + "America").
-        words = region.split(" ")
-        if len(words) > 1:
-            space_w = draw.textbbox((0, 0), " ", font=over_el.value.font)[2]
-            tight_gap = max(1, space_w // 3)
-            word_widths = [draw.textbbox((0, 0), w_, font=over_el.value.font)[2] for w_ in words]
-            total_w = sum(word_widths) + tight_gap * (len(words) - 1)
-            x = right_edge - total_w
-            for i, w_ in enumerate(words):
-                draw.text((x, value_y), w_, fill=over_el.value.color, font=over_el.value.font)
-                x += word_widths[i] + tight_gap
-        else:
-            region_text_w = draw.textbbox((0, 0), region, font=over_el.value.font)[2]
-            draw.text((right_edge - region_text_w, value_y), region, fill=over_el.value.color, font=over_el.value.font)
+        for dx, word in self._region_layout(region, draw):
+            draw.text((right_edge + dx, value_y), word, fill=over_el.value.color, font=over_el.value.font)
 
-        # ── Bottom bar — clear before drawing into the caller-provided buffer ──
+        # ── Bottom bar — reset the caller-provided buffer to the static plate ──
+        bot_img.paste(self._hud_bot_plate)
         draw = ImageDraw.Draw(bot_img)
-        draw.rectangle([0, 0, w, bot_h], fill=self._hud_bg)
-        draw.line([0, 0, w, 0], fill=self._hud_bot_border)
 
         # ALT cell
         alt_el = self._resolved["alt"]
         alt_x = g
-        draw.text((alt_x, label_y), "ALT", fill=alt_el.label.color, font=alt_el.label.font)
         draw.text((alt_x, value_y), alt_val, fill=alt_el.value.color, font=alt_el.value.font)
         alt_text_w = draw.textbbox((0, 0), alt_val, font=alt_el.value.font)[2]
         draw.text((alt_x + alt_text_w + self._hud_unit_gap, value_y + alt_el.unit_baseline_offset),
@@ -632,7 +822,6 @@ class LcdDisplay:
         # VEL cell
         vel_el = self._resolved["vel"]
         vel_x = alt_x + alt_el.cell_width + g
-        draw.text((vel_x, label_y), "VEL", fill=vel_el.label.color, font=vel_el.label.font)
         draw.text((vel_x, value_y), vel_val, fill=vel_el.value.color, font=vel_el.value.font)
         vel_text_w = draw.textbbox((0, 0), vel_val, font=vel_el.value.font)[2]
         draw.text((vel_x + vel_text_w + self._hud_unit_gap, value_y + vel_el.unit_baseline_offset),
@@ -641,29 +830,44 @@ class LcdDisplay:
         # Data age indicator (right-aligned)
         age_el = self._resolved["age"]
         right_edge = w - g
-        age_label_w = draw.textbbox((0, 0), "LAST", font=age_el.label.font)[2]
-        draw.text((right_edge - age_label_w, label_y), "LAST", fill=age_el.label.color, font=age_el.label.font)
         age_text_w = draw.textbbox((0, 0), age_val, font=age_el.value.font)[2]
         draw.text((right_edge - age_text_w, value_y), age_val, fill=age_el.value.color, font=age_el.value.font)
 
-        return self._image_to_rgb565_bytes(top_img), self._image_to_rgb565_bytes(bot_img), cache_key
+        top_px = self._image_to_rgb565(top_img)
+        bot_px = self._image_to_rgb565(bot_img)
+        top_px.flags.writeable = False
+        bot_px.flags.writeable = False
+        return top_px, bot_px, cache_key
 
-    def apply_hud_bytes(self, top_bytes: bytes, bottom_bytes: bytes, cache_key: str) -> None:
-        """Atomically swap in newly-rendered HUD bytes (called from HudComposer).
+    def apply_hud_pixels(self, top_px: np.ndarray, bottom_px: np.ndarray, cache_key: str) -> None:
+        """Atomically swap in newly-rendered HUD pixels (called from HudComposer).
 
-        Increments per-bar version counters so the render thread knows to
-        retransmit each bar on its next frame. No-op if the cache key is
-        unchanged (the composer wakes on a fixed interval and may produce
-        identical output between ticks).
+        Increments the version counter of each bar whose pixels actually
+        changed, so the render thread retransmits only that bar (e.g. a
+        ticking data-age value resends the bottom bar, not both). No-op if
+        the cache key is unchanged (the composer wakes on a fixed interval
+        and may produce identical output between ticks).
         """
         with self._hud_lock:
             if cache_key == self._hud_cache_key:
                 return
-            self._hud_top_bytes = top_bytes
-            self._hud_bottom_bytes = bottom_bytes
+            prev_top = self._hud_top_px
+            prev_bottom = self._hud_bottom_px
+        # Compare outside the lock so the render thread never waits on it.
+        # Safe only while calls are serialized: run_loop applies the first
+        # HUD frame on the main thread before hud_composer.start(), and
+        # after that only the composer calls this. A concurrent second
+        # caller would need the comparison moved under the lock.
+        top_changed = prev_top is None or not np.array_equal(prev_top, top_px)
+        bottom_changed = prev_bottom is None or not np.array_equal(prev_bottom, bottom_px)
+        with self._hud_lock:
             self._hud_cache_key = cache_key
-            self._hud_top_version += 1
-            self._hud_bottom_version += 1
+            if top_changed:
+                self._hud_top_px = top_px
+                self._hud_top_version += 1
+            if bottom_changed:
+                self._hud_bottom_px = bottom_px
+                self._hud_bottom_version += 1
 
     # ─── Crew view ──────────────────────────────────────────────────────
 
@@ -852,15 +1056,14 @@ class LcdDisplay:
             margin=margin, color=color)
 
         # Convert to RGB565 and write to frame buffer
-        rgb565_bytes = self._image_to_rgb565_bytes(img)
-        self._frame_buf[:] = rgb565_bytes
+        self._image_to_rgb565(img, out=self._frame_buf_np)
 
         # Send to display
         if self.driver:
             self.driver.display_raw(self._frame_buf)
         else:
             self._preview_frame_count += 1
-            self._save_preview(self._frame_buf)
+            self._queue_preview()
 
         self._crew_cache_key = key
         return True
@@ -868,57 +1071,92 @@ class LcdDisplay:
     # ─── RGB565 conversion ────────────────────────────────────────────────
 
     @staticmethod
-    def _image_to_rgb565_bytes(image: Image.Image) -> bytes:
-        """Convert PIL Image to RGB565 bytes for direct display."""
-        img_np = np.array(image)
-        r = img_np[..., 0].astype(np.uint16)
-        g = img_np[..., 1].astype(np.uint16)
-        b = img_np[..., 2].astype(np.uint16)
-        rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-        return rgb565.astype('>u2').tobytes()
-
-    def _precompute_rgb565(self):
-        """Pre-compute RGB565 data for all cached frames.
-
-        Stores bytes (for display_raw) and big-endian numpy uint16 arrays
-        (for np.copyto frame copies and partial-update region extraction).
+    def _image_to_rgb565(image: Image.Image, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert PIL Image to a big-endian RGB565 array (same layout as _frame_buf_np).
+
+        Packs with in-place shifts/masks on the widened channels; a
+        per-channel 256-entry LUT gather measured ~3x slower than that.
         """
-        logger.info("Pre-computing RGB565 frame data...")
-        self.frame_bytes_cache = []
-        self.frame_np_cache: List[np.ndarray] = []
-        for frame in self.frame_cache:
-            img_np = np.array(frame)
-            r = img_np[..., 0].astype(np.uint16)
-            g = img_np[..., 1].astype(np.uint16)
-            b = img_np[..., 2].astype(np.uint16)
-            rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            frame_be = rgb565.astype('>u2')
-            self.frame_np_cache.append(frame_be)
-            self.frame_bytes_cache.append(frame_be.tobytes())
-        logger.info(f"Pre-computed {len(self.frame_bytes_cache)} frames")
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        img_np = np.asarray(image)
+        if out is None:
+            out = np.empty(img_np.shape[:2], dtype='>u2')
+        return _rgb_to_rgb565_array(img_np[..., 0], img_np[..., 1], img_np[..., 2], out=out)
 
     # ─── Frame cache ──────────────────────────────────────────────────────
 
     def _load_or_generate_frames(self):
-        """Load pre-rendered frames from cache or generate them."""
-        cache_file = self.cache_dir / f"globe_{self.num_frames}f.npz"
+        """Load pre-rendered frames from cache or generate them.
+
+        The cache is a raw .npy of the packed (num_frames, height, width)
+        big-endian RGB565 frames, so a cached start is one file read with no
+        decompression, PIL round-trip or RGB565 conversion. A legacy RGB888
+        globe_{N}f.npz cache is converted once and re-saved in that format.
+        """
+        cache_file = self.cache_dir / f"globe_{self.num_frames}f_rgb565.npy"
 
         if cache_file.exists():
             logger.info("Loading cached Earth frames...")
             try:
-                data = np.load(cache_file)
-                for i in range(self.num_frames):
-                    img_array = data[f'frame_{i}']
-                    self.frame_cache.append(Image.fromarray(img_array))
+                frames = np.load(cache_file)
+                expected = (self.num_frames, self.height, self.width)
+                if frames.shape != expected or frames.dtype != np.dtype('>u2'):
+                    raise ValueError(f"cached frames are {frames.dtype} {frames.shape}, "
+                                     f"expected >u2 {expected}")
+                self.frame_np_cache = frames
                 self.frames_generated = True
                 # Update globe geometry from first frame
                 self._update_globe_geometry()
-                logger.info(f"Loaded {len(self.frame_cache)} cached frames")
+                logger.info(f"Loaded {len(self.frame_np_cache)} cached frames")
                 return
             except Exception as e:
                 logger.warning(f"Failed to load cache: {e}, regenerating...")
 
+        legacy_file = self.cache_dir / f"globe_{self.num_frames}f.npz"
+        if legacy_file.exists():
+            logger.info("Converting legacy RGB888 frame cache...")
+            try:
+                data = np.load(legacy_file)
+                frames = np.empty((self.num_frames, self.height, self.width), dtype='>u2')
+                for i in range(self.num_frames):
+                    rgb = data[f'frame_{i}']
+                    _rgb_to_rgb565_array(rgb[..., 0], rgb[..., 1], rgb[..., 2], out=frames[i])
+                self.frame_np_cache = frames
+                if self._save_frame_cache(cache_file):
+                    # Never read again once the .npy exists; ~110 MB on the SD card
+                    legacy_file.unlink(missing_ok=True)
+                self.frames_generated = True
+                self._update_globe_geometry()
+                return
+            except Exception as e:
+                logger.warning(f"Failed to convert legacy cache: {e}, regenerating...")
+
         self._generate_frames()
+        self._save_frame_cache(cache_file)
+
+    def _save_frame_cache(self, cache_file: Path) -> bool:
+        """Write frame_np_cache to cache_file as a raw .npy (uncompressed).
+
+        Written to a sibling temp file and renamed into place, so a power
+        cut mid-write (~70 MB on an SD card) never leaves a truncated cache
+        that has to be detected and regenerated on the next boot.
+        Returns True if the cache was written, False if saving failed.
+        """
+        logger.info("Saving frames to cache...")
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                np.save(f, self.frame_np_cache)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_file.replace(cache_file)
+            logger.info("Frames cached successfully")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save cache: {e}")
+            tmp_file.unlink(missing_ok=True)
+            return False
 
     def _generate_frames(self):
         """Pre-render all Earth rotation frames using Cartopy.
@@ -966,33 +1204,26 @@ class LcdDisplay:
         logger.info(f"Generating {self.num_frames} Earth frames "
                      f"({n_workers} workers, 110m resolution)...")
 
-        self.frame_cache = []
+        # Workers return frames already packed to RGB565; each is copied
+        # into its slot as it arrives.
+        frames = np.empty((self.num_frames, self.height, self.width), dtype='>u2')
         with mp.Pool(n_workers) as pool:
-            for i, frame_array in enumerate(
+            for i, frame_px in enumerate(
                 pool.imap(self._render_globe_frame_worker, work_args)
             ):
-                self.frame_cache.append(Image.fromarray(frame_array))
+                np.copyto(frames[i], frame_px)
                 if (i + 1) % 10 == 0 or (i + 1) == self.num_frames:
                     logger.info(f"  {i+1}/{self.num_frames} frames done")
 
+        self.frame_np_cache = frames
         self._update_globe_geometry()
 
-        # Save to cache (uncompressed — much faster to write than gzip)
-        logger.info("Saving frames to cache...")
-        try:
-            frame_dict = {f'frame_{i}': np.array(frame)
-                          for i, frame in enumerate(self.frame_cache)}
-            np.savez(self.cache_dir / f"globe_{self.num_frames}f.npz", **frame_dict)
-            logger.info("Frames cached successfully")
-        except Exception as e:
-            logger.warning(f"Failed to save cache: {e}")
-
         self.frames_generated = True
         logger.info("Frame generation complete!")
 
     def _update_globe_geometry(self):
         """Compute globe center and radius from the rendered frames."""
-        if not self.frame_cache:
+        if self.frame_np_cache.size == 0:
             return
         # All frames are the same size, so use the first one
         # The globe is rendered at globe_scale of the smaller dimension
@@ -1005,40 +1236,31 @@ class LcdDisplay:
     def _render_globe_frame_worker(args: tuple) -> np.ndarray:
         """Render a single globe frame. Multiprocessing-friendly (static).
 
-        Returns the composited frame as a numpy uint8 RGB array.
+        Returns the composited frame as a (height, width) big-endian RGB565
+        array, ready to drop into frame_np_cache.
         """
         central_lon, width, height, globe_scale, globe_cfg = args
 
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
         import cartopy.crs as ccrs
-        import cartopy.feature as cfeature
 
         bg_hex = rgb_to_hex(globe_cfg['background'])
         globe_size = int(min(width, height) * globe_scale)
-        dpi = 100
-        fig = plt.figure(figsize=(globe_size / dpi, globe_size / dpi), dpi=dpi, facecolor=bg_hex)
+        fig = _globe_figure(globe_size, bg_hex)
+        fig.clear()
 
         projection = ccrs.Orthographic(central_longitude=central_lon, central_latitude=0)
-        ax = fig.add_subplot(1, 1, 1, projection=projection)
+        # Axes fill the figure outright; no subplot grid or layout pass.
+        ax = fig.add_axes((0, 0, 1, 1), projection=projection)
         ax.set_facecolor(bg_hex)
         ax.set_global()
 
         # Use 110m (lowest) resolution for faster geometry processing
-        ax.add_feature(cfeature.NaturalEarthFeature(
-            'physical', 'ocean', '110m',
-            facecolor=rgb_to_hex(globe_cfg['ocean_color']), edgecolor='none'), zorder=0)
-        ax.add_feature(cfeature.NaturalEarthFeature(
-            'physical', 'land', '110m',
-            facecolor=rgb_to_hex(globe_cfg['land_color']),
-            edgecolor=rgb_to_hex(globe_cfg['land_border_color']),
-            linewidth=globe_cfg['land_border_width']), zorder=1)
-        ax.add_feature(cfeature.NaturalEarthFeature(
-            'physical', 'coastline', '110m',
-            facecolor='none',
-            edgecolor=rgb_to_hex(globe_cfg['coastline_color']),
-            linewidth=globe_cfg['coastline_width']), zorder=2)
+        features = _natural_earth_features(
+            tuple(globe_cfg['ocean_color']), tuple(globe_cfg['land_color']),
+            tuple(globe_cfg['land_border_color']), globe_cfg['land_border_width'],
+            tuple(globe_cfg['coastline_color']), globe_cfg['coastline_width'])
+        for zorder, feature in enumerate(features):
+            ax.add_feature(feature, zorder=zorder)
         ax.gridlines(color=rgb_to_hex(globe_cfg['grid_color']),
                       linewidth=globe_cfg['grid_width'],
                       alpha=globe_cfg['grid_alpha'], linestyle='-',
@@ -1046,39 +1268,60 @@ class LcdDisplay:
                       ylocs=np.arange(-90, 91, globe_cfg['grid_lat_spacing']))
         ax.spines['geo'].set_visible(False)
 
-        plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
-
         # Render to raw RGBA buffer instead of PNG encode/decode round-trip
         fig.canvas.draw()
         rgba = np.asarray(fig.canvas.buffer_rgba())
-        plt.close(fig)
-
-        globe_img = rgba[:, :, :3]  # drop alpha channel
 
-        # Composite onto full-size canvas
-        final = np.zeros((height, width, 3), dtype=np.uint8)
-        final[:, :] = globe_cfg['background']
-        x_off = (width - globe_img.shape[1]) // 2
-        y_off = (height - globe_img.shape[0]) // 2
-        final[y_off:y_off + globe_img.shape[0],
-              x_off:x_off + globe_img.shape[1]] = globe_img
+        # Composite onto a background-filled full-size RGB565 canvas, packing
+        # the Agg buffer's RGB channels (alpha ignored) straight into place:
+        # no intermediate RGB888 frame, and a third less to pickle back.
+        final = np.full((height, width), _rgb_to_rgb565(*globe_cfg['background']), dtype='>u2')
+        gh, gw = rgba.shape[:2]
+        x_off = (width - gw) // 2
+        y_off = (height - gh) // 2
+        _rgb_to_rgb565_array(rgba[..., 0], rgba[..., 1], rgba[..., 2],
+                             out=final[y_off:y_off + gh, x_off:x_off + gw])
 
         return final
 
     # ─── ISS marker (RGB565 byte-buffer operations) ──────────────────────
 
-    def _calc_iss_screen_pos(self, lat: float, lon: float, central_lon: float):
-        """Calculate ISS screen position, visibility, and opacity.
+    def _init_marker(self):
+        """Prepare the marker's disk-mask and sprite caches and per-ring constants."""
+        m = THEME.marker
+        # Filled-disk masks keyed by integer radius, built lazily by _disk_mask()
+        self._disk_cache: dict[int, np.ndarray] = {}
+        # Marker sprites keyed by quantized opacity level, built lazily by _marker_sprite()
+        self._marker_sprites: dict[int, Tuple[np.ndarray, np.ndarray, int]] = {}
+        # Per-ring geometry and brightness at full size/opacity, outermost
+        # first. The theme is fixed for the process lifetime, so these are
+        # baked once; each draw only scales them by size and opacity.
+        # Brightness is cast to int for the fixed-point scaling, which
+        # would reject float theme values.
+        ring_idx = np.arange(m.ring_count)
+        self._marker_ring_radii = (m.outer_ring_radius - ring_idx * m.ring_step).astype(np.float64)
+        self._marker_ring_bright = np.asarray(
+            m.ring_brightness_base + ring_idx * m.ring_brightness_step, dtype=np.int64)
+
+    def _calc_iss_screen_pos(self, lat: float, lon: float, frame_idx: int):
+        """Calculate ISS screen position, visibility, and opacity on a globe frame.
 
         Returns (px, py, opacity) or None if ISS is not visible.
         """
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        central_lon_rad = math.radians(central_lon)
+        if self._iss_trig_key != (lat, lon):
+            lat_rad = math.radians(lat)
+            lon_rad = math.radians(lon)
+            self._iss_trig = (math.cos(lat_rad), math.sin(lat_rad),
+                              math.cos(lon_rad), math.sin(lon_rad))
+            self._iss_trig_key = (lat, lon)
+        cos_lat, sin_lat, cos_lon, sin_lon = self._iss_trig
+        cos_cl = self._frame_cos_cl[frame_idx]
+        sin_cl = self._frame_sin_cl[frame_idx]
 
-        cos_c = math.cos(lat_rad) * math.cos(lon_rad - central_lon_rad)
+        # cos/sin(lon - central_lon) by the angle-difference identities
+        cos_c = cos_lat * (cos_lon * cos_cl + sin_lon * sin_cl)
 
-        horizon_threshold = -math.sqrt(1 - 1 / (self.iss_orbit_scale ** 2))
+        horizon_threshold = self._horizon_threshold
 
         if cos_c < horizon_threshold:
             return None
@@ -1093,8 +1336,8 @@ class LcdDisplay:
             opacity = 1.0
 
         # Surface point in orthographic projection
-        x_surface = math.cos(lat_rad) * math.sin(lon_rad - central_lon_rad)
-        y_surface = math.sin(lat_rad)
+        x_surface = cos_lat * (sin_lon * cos_cl - cos_lon * sin_cl)
+        y_surface = sin_lat
 
         # ISS position (exaggerated altitude)
         x_iss = x_surface * self.iss_orbit_scale
@@ -1106,11 +1349,14 @@ class LcdDisplay:
         if not (0 <= px < self.width and 0 <= py < self.height):
             return None
 
-        # Check occlusion when marker is inside Earth disk on back side
+        # Check occlusion when marker is inside Earth disk on back side.
+        # Compare squared distances; only take the sqrt once occluded
+        # (occlusion = 1 - (R - d) / R = d / R).
         if cos_c < 0:
-            dist = math.sqrt((px - self.globe_center_x)**2 + (py - self.globe_center_y)**2)
-            if dist < self.globe_radius_px:
-                occlusion = 1.0 - (self.globe_radius_px - dist) / self.globe_radius_px
+            dist_sq = (px - self.globe_center_x)**2 + (py - self.globe_center_y)**2
+            radius = self.globe_radius_px
+            if dist_sq < radius * radius:
+                occlusion = math.sqrt(dist_sq) / radius
                 opacity *= occlusion * m.occlusion_factor
 
         if opacity < m.opacity_cutoff:
@@ -1118,88 +1364,125 @@ class LcdDisplay:
 
         return (px, py, opacity)
 
-    def _draw_iss_marker_rgb565(self, px: int, py: int, opacity: float) -> Tuple[int, int, int, int]:
-        """Draw ISS marker into self._frame_buf_np using NumPy vectorised operations.
-
-        Draws concentric glow rings + core + center dot.
-        Returns the (x0, y0, x1, y1) bounding box of the painted region so the
-        caller can erase it on the next partial update.
+    def _disk_mask(self, r: int) -> np.ndarray:
+        """Return the (2r+1)-square boolean mask of a filled disk of radius r.
 
-        Uses pre-allocated arrays (_marker_dist_sq_full, _marker_color_buf,
-        _marker_mask) to avoid per-frame numpy allocations that cause GC jitter.
+        Built scanline by scanline: row dy covers |dx| <= isqrt(r² - dy²),
+        the same pixel set as dx² + dy² <= r². Cached per radius, so each
+        distinct radius is only rasterised once.
+        """
+        mask = self._disk_cache.get(r)
+        if mask is None:
+            offsets = np.arange(-r, r + 1)
+            half_widths = np.array([math.isqrt(r * r - d * d) for d in offsets.tolist()])
+            mask = np.abs(offsets)[None, :] <= half_widths[:, None]
+            self._disk_cache[r] = mask
+        return mask
+
+    def _marker_sprite(self, level: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Return (sprite, mask, r) for the marker at opacity level/_MARKER_OPACITY_LEVELS.
+
+        sprite is a (2r+1)-square big-endian RGB565 patch centered on the
+        marker and mask marks its non-zero pixels, the ones to blit: RGB565
+        0 is transparent, so a dim ring that packs to black at low opacity
+        leaves the globe visible instead of drawing a black halo.
+        Concentric glow rings, core and center dot are stamped from cached
+        disk masks outermost → innermost so inner shapes overwrite outer
+        ones. Cached per level.
         """
+        cached = self._marker_sprites.get(level)
+        if cached is not None:
+            return cached
+
         m = THEME.marker
+        opacity = level / _MARKER_OPACITY_LEVELS
         size_scale = m.min_size_scale + (m.max_size_scale - m.min_size_scale) * opacity
-
-        # Glow rings: list of (radius_squared, rgb565_color), outermost first
-        rings = []
-        for i in range(m.ring_count):
-            r = int((m.outer_ring_radius - i * m.ring_step) * size_scale)
-            if r < 1:
-                continue
-            base_brightness = int((m.ring_brightness_base + i * m.ring_brightness_step) * opacity)
-            color = _rgb_to_rgb565(int(m.glow_color[0] * opacity), base_brightness, base_brightness)
-            rings.append((r * r, color))
+        # Opacity in 8.8 fixed point: channel scaling is (c * op_q8) >> 8,
+        # integer-only (256 == fully opaque, so 255 stays 255).
+        op_q8 = int(opacity * 256)
+
+        # Glow rings: list of (radius, rgb565_color), outermost first.
+        # Radii and colors for all rings are computed in one vectorised pass.
+        ring_radii = (self._marker_ring_radii * size_scale).astype(np.int32)
+        ring_bright = (self._marker_ring_bright * op_q8) >> 8
+        ring_red = np.full_like(ring_bright, (int(m.glow_color[0]) * op_q8) >> 8)
+        ring_colors = _rgb_to_rgb565_array(ring_red, ring_bright, ring_bright)
+        rings = [(r, color)
+                 for r, color in zip(ring_radii.tolist(), ring_colors.tolist())
+                 if r >= 1]
 
         core_r = max(1, int(m.core_radius * size_scale))
-        core_color = _rgb_to_rgb565(int(m.core_color[0] * opacity), 0, 0)
+        core_color = _rgb_to_rgb565((int(m.core_color[0]) * op_q8) >> 8, 0, 0)
 
-        center_b = int(m.center_color[0] * opacity)
+        center_b = (int(m.center_color[0]) * op_q8) >> 8
         center_color = _rgb_to_rgb565(center_b, center_b, center_b)
 
-        # Bounding box (clamped to screen)
-        max_r = int(m.outer_ring_radius * size_scale) + 1
-        x0 = max(0, px - max_r);  x1 = min(self.width - 1,  px + max_r)
-        y0 = max(0, py - max_r);  y1 = min(self.height - 1, py + max_r)
-        h_bb = y1 - y0 + 1
-        w_bb = x1 - x0 + 1
-
-        # Slice pre-computed distance-squared grid (no allocation)
-        dy_start = (y0 - py) + self._marker_max_r
-        dx_start = (x0 - px) + self._marker_max_r
-        dist_sq = self._marker_dist_sq_full[dy_start:dy_start + h_bb, dx_start:dx_start + w_bb]
-
-        # Reuse pre-allocated color buffer (zero the needed region)
-        color_buf = self._marker_color_buf[:h_bb, :w_bb]
-        color_buf[:] = 0
-
-        # Paint outermost → innermost so inner shapes overwrite outer ones
-        for ring_r_sq, ring_color in rings:
-            color_buf[dist_sq <= ring_r_sq] = ring_color
-        color_buf[dist_sq <= core_r * core_r] = core_color
+        r = max([core_r] + [ring_r for ring_r, _ in rings])
+        sprite = np.zeros((2 * r + 1, 2 * r + 1), dtype='>u2')
+        for ring_r, color in rings:
+            sprite[r - ring_r:r + ring_r + 1, r - ring_r:r + ring_r + 1][self._disk_mask(ring_r)] = color
+        sprite[r - core_r:r + core_r + 1, r - core_r:r + core_r + 1][self._disk_mask(core_r)] = core_color
         if center_b > 0:
-            color_buf[dist_sq <= 1] = center_color
+            sprite[r - 1:r + 2, r - 1:r + 2][self._disk_mask(1)] = center_color
+        sprite.flags.writeable = False
+        mask = sprite != 0
+        mask.flags.writeable = False
+
+        self._marker_sprites[level] = (sprite, mask, r)
+        return sprite, mask, r
 
-        # Write only non-zero pixels into the shared frame-buffer numpy view
-        mask = self._marker_mask[:h_bb, :w_bb]
-        np.not_equal(color_buf, 0, out=mask)
-        self._frame_buf_np[y0:y1 + 1, x0:x1 + 1][mask] = color_buf[mask]
+    def _draw_iss_marker_rgb565(self, px: int, py: int,
+                                opacity: float) -> Optional[Tuple[int, int, int, int]]:
+        """Draw ISS marker into self._frame_buf_np from a cached sprite.
+
+        Opacity is quantized to _MARKER_OPACITY_LEVELS and the matching
+        pre-rasterised sprite (see _marker_sprite) is blitted through its
+        non-zero mask with one masked np.copyto.
+        Returns the (x0, y0, x1, y1) bounding box of the painted region so the
+        caller can erase it on the next partial update, or None if the marker
+        lies entirely under a HUD bar and nothing was drawn.
+
+        The marker is clipped to the rows between the HUD bars: the HUD owns
+        those rows, and keeping the marker (and therefore the erase on the
+        next update) out of them means globe pixels never overwrite HUD text.
+        """
+        level = max(1, min(_MARKER_OPACITY_LEVELS, round(opacity * _MARKER_OPACITY_LEVELS)))
+        sprite, mask, r = self._marker_sprite(level)
+
+        # Bounding box, clamped to the screen columns and the globe rows
+        # between the HUD bars.
+        x0 = max(0, px - r);  x1 = min(self.width - 1, px + r)
+        y0 = max(self._hud_top_height, py - r)
+        y1 = min(self.height - self._hud_bot_height - 1, py + r)
+        if x0 > x1 or y0 > y1:
+            return None
+
+        sx0 = x0 - (px - r); sy0 = y0 - (py - r)
+        sx1 = sx0 + (x1 - x0) + 1; sy1 = sy0 + (y1 - y0) + 1
+        np.copyto(self._frame_buf_np[y0:y1 + 1, x0:x1 + 1], sprite[sy0:sy1, sx0:sx1],
+                  where=mask[sy0:sy1, sx0:sx1])
 
         return (x0, y0, x1, y1)
 
-    def _patch_hud_bytes(self, frame_buf: bytearray):
-        """Patch cached HUD bar bytes into a frame buffer.
+    def _patch_hud(self):
+        """Patch cached HUD bar pixels into _frame_buf_np.
 
         Snapshots both bars under the HUD lock so the composer can't tear
-        the read by swapping bytes between the two assignments.
+        the read by swapping pixels between the two assignments.
         """
         with self._hud_lock:
-            top_bytes = self._hud_top_bytes
-            bottom_bytes = self._hud_bottom_bytes
+            top_px = self._hud_top_px
+            bottom_px = self._hud_bottom_px
             top_version = self._hud_top_version
             bottom_version = self._hud_bottom_version
-        if top_bytes is None or bottom_bytes is None:
+        if top_px is None or bottom_px is None:
             return
 
-        top_size = self.width * self._hud_top_height * 2
-        bot_size = self.width * self._hud_bot_height * 2
-        bot_offset = (self.height - self._hud_bot_height) * self.width * 2
-
         # Top bar: rows 0..top_height
-        frame_buf[0:top_size] = top_bytes
+        np.copyto(self._frame_buf_np[self._hud_top_rows], top_px)
 
         # Bottom bar: rows (height - bot_height)..height
-        frame_buf[bot_offset:bot_offset + bot_size] = bottom_bytes
+        np.copyto(self._frame_buf_np[self._hud_bot_rows], bottom_px)
 
         # Caller (full update) has just transmitted these bars in the same
         # full-frame SPI write, so mark them sent — otherwise the post-globe
@@ -1209,11 +1492,24 @@ class LcdDisplay:
 
     # ─── Main update loop entry point ─────────────────────────────────────
 
+    def rotation_frame_at(self, now_ns: int) -> int:
+        """Globe frame index for a monotonic_ns timestamp (integer math only)."""
+        elapsed_ns = (now_ns - self._rotation_start_ns) % self._rotation_period_ns
+        return elapsed_ns * self.num_frames // self._rotation_period_ns
+
+    def ns_until_next_frame(self, now_ns: int) -> int:
+        """Nanoseconds from now_ns to the next globe frame boundary."""
+        elapsed_ns = (now_ns - self._rotation_start_ns) % self._rotation_period_ns
+        next_idx = elapsed_ns * self.num_frames // self._rotation_period_ns + 1
+        # Ceil so the boundary is never reported before the index flips.
+        boundary_ns = -(-next_idx * self._rotation_period_ns // self.num_frames)
+        return boundary_ns - elapsed_ns
+
     def update_with_telemetry(self, telemetry: "ISSFix"):
         """Update the display with current ISS telemetry.
 
         Render-thread fast path. PIL HUD rendering happens off-thread in the
-        HudComposer; this method only consumes the latest pre-rendered bytes
+        HudComposer; this method only consumes the latest pre-rendered pixels
         and pushes them to SPI. Three transmission strategies, chosen per frame:
 
         Forced full update (init, view-toggle, error recovery):
@@ -1222,14 +1518,15 @@ class LcdDisplay:
         Globe-region update (typical):
           Refresh the disc bbox in _frame_buf_np → draw marker → send the
           union of disc + marker bboxes (~17 ms SPI). When the composer has
-          produced new HUD bytes since our last transmission, follow up with
+          produced new HUD pixels since our last transmission, follow up with
           one or two HUD-bar region writes (~5 ms each). HUD updates therefore
           cost ~5–10 ms of extra SPI per frame, never block on PIL, and never
           force a full-frame transfer.
 
         Partial update (globe and HUD unchanged):
           Erase previous marker → draw new marker → send only the two tiny
-          marker bounding-box regions (~1 KB total).
+          marker bounding-box regions (~1 KB total). Skipped entirely when
+          the marker's screen position and opacity are also unchanged.
         """
         if not self.frames_generated:
             logger.warning("Frames not yet generated")
@@ -1240,9 +1537,7 @@ class LcdDisplay:
         # Hybrid frame indexing: advance by one frame per render, but resync
         # to wall-clock if we've fallen too far behind (long stall recovery).
         # Eliminates visible angular skips when a render goes over budget.
-        elapsed = time.time() - self._rotation_start_time
-        rotation_progress = (elapsed % self._rotation_period) / self._rotation_period
-        target_frame = int(rotation_progress * self.num_frames) % self.num_frames
+        target_frame = self.rotation_frame_at(time.monotonic_ns())
         prev_frame = self._prev_frame_idx
         if prev_frame is None:
             current_frame = target_frame
@@ -1252,15 +1547,14 @@ class LcdDisplay:
                 current_frame = target_frame
             else:
                 current_frame = (prev_frame + 1) % self.num_frames
-        central_lon = (current_frame * (360.0 / self.num_frames)) - 180.0
 
         globe_changed = current_frame != self._prev_frame_idx
-        iss_pos = self._calc_iss_screen_pos(telemetry.latitude, telemetry.longitude, central_lon)
+        iss_pos = self._calc_iss_screen_pos(telemetry.latitude, telemetry.longitude, current_frame)
 
         if self._force_full_frame:
             # Forced resync: send everything in one transfer using whatever
-            # HUD bytes the composer has produced. _do_full_update →
-            # _patch_hud_bytes already updates _last_sent_*_version, so the
+            # HUD pixels the composer has produced. _do_full_update →
+            # _patch_hud already updates _last_sent_*_version, so the
             # post-globe HUD path won't re-transmit immediately.
             self._do_full_update(current_frame, iss_pos)
             self._force_full_frame = False
@@ -1268,16 +1562,20 @@ class LcdDisplay:
             self._do_globe_region_update(current_frame, iss_pos)
             self._flush_hud_if_dirty()
         else:
-            self._do_partial_update(current_frame, iss_pos)
+            # Same globe frame: the panel already shows this marker unless
+            # it moved or faded, so skip the erase/redraw and its SPI write.
+            if iss_pos != self._prev_iss_pos:
+                self._do_partial_update(current_frame, iss_pos)
             self._flush_hud_if_dirty()
 
         self._prev_frame_idx = current_frame
+        self._prev_iss_pos = iss_pos
 
         # Preview mode: save occasional PNGs
         if self.driver is None:
             self._preview_frame_count += 1
             if self._preview_frame_count % 30 == 1:
-                self._save_preview(self._frame_buf)
+                self._queue_preview()
 
     def _flush_hud_if_dirty(self) -> None:
         """Transmit at most one stale HUD bar this frame.
@@ -1295,23 +1593,18 @@ class LcdDisplay:
         with self._hud_lock:
             top_version = self._hud_top_version
             bottom_version = self._hud_bottom_version
-            top_bytes = self._hud_top_bytes
-            bottom_bytes = self._hud_bottom_bytes
-
-        if top_bytes is not None and top_version != self._last_sent_top_version:
-            top_h = self._hud_top_height
-            top_size = self.width * top_h * 2
-            self._frame_buf[0:top_size] = top_bytes
-            self.display_region(0, 0, self.width - 1, top_h - 1)
+            top_px = self._hud_top_px
+            bottom_px = self._hud_bottom_px
+
+        if top_px is not None and top_version != self._last_sent_top_version:
+            np.copyto(self._frame_buf_np[self._hud_top_rows], top_px)
+            self.display_region(0, 0, self.width - 1, self._hud_top_height - 1)
             self._last_sent_top_version = top_version
             return
 
-        if bottom_bytes is not None and bottom_version != self._last_sent_bottom_version:
-            bot_h = self._hud_bot_height
-            bot_size = self.width * bot_h * 2
-            bot_offset = (self.height - bot_h) * self.width * 2
-            self._frame_buf[bot_offset:bot_offset + bot_size] = bottom_bytes
-            self.display_region(0, self.height - bot_h, self.width - 1, self.height - 1)
+        if bottom_px is not None and bottom_version != self._last_sent_bottom_version:
+            np.copyto(self._frame_buf_np[self._hud_bot_rows], bottom_px)
+            self.display_region(0, self.height - self._hud_bot_height, self.width - 1, self.height - 1)
             self._last_sent_bottom_version = bottom_version
 
     def _do_full_update(self, frame_idx: int, iss_pos):
@@ -1323,20 +1616,25 @@ class LcdDisplay:
             px, py, opacity = iss_pos
             new_bbox = self._draw_iss_marker_rgb565(px, py, opacity)
 
-        self._patch_hud_bytes(self._frame_buf)
+        self._patch_hud()
 
         if self.driver:
             self.driver.display_raw(self._frame_buf)
 
         self._prev_marker_bbox = new_bbox
 
+    def _restore_globe_region(self, frame_idx: int, x0: int, y0: int, x1: int, y1: int):
+        """Copy an inclusive rectangle of a cached globe frame into _frame_buf_np."""
+        np.copyto(self._frame_buf_np[y0:y1 + 1, x0:x1 + 1],
+                  self.frame_np_cache[frame_idx][y0:y1 + 1, x0:x1 + 1])
+
     def _do_globe_region_update(self, frame_idx: int, iss_pos):
         """Globe changed but HUD didn't: send only the disc bbox + marker.
 
         Refreshes the globe disc into _frame_buf_np from the new cached frame,
         draws the marker, then sends a single SPI transfer covering the union
         of the disc bbox, the old marker bbox, and the new marker bbox. The
-        HUD bytes are not retransmitted, dropping typical SPI cost from
+        HUD pixels are not retransmitted, dropping typical SPI cost from
         ~51 ms (full frame) to ~17 ms.
         """
         old_bbox = self._prev_marker_bbox
@@ -1346,12 +1644,10 @@ class LcdDisplay:
         # to (iss_orbit_scale - 1) * radius pixels). When inside the disc,
         # this is harmless extra work — the disc copy below overwrites it.
         if old_bbox is not None:
-            x0, y0, x1, y1 = old_bbox
-            self._frame_buf_np[y0:y1 + 1, x0:x1 + 1] = self.frame_np_cache[frame_idx][y0:y1 + 1, x0:x1 + 1]
+            self._restore_globe_region(frame_idx, *old_bbox)
 
         # Refresh the disc region from the new globe frame.
-        dx0, dy0, dx1, dy1 = self._globe_disc_bbox
-        self._frame_buf_np[dy0:dy1 + 1, dx0:dx1 + 1] = self.frame_np_cache[frame_idx][dy0:dy1 + 1, dx0:dx1 + 1]
+        self._restore_globe_region(frame_idx, *self._globe_disc_bbox)
 
         # Draw new marker.
         new_bbox = None
@@ -1379,8 +1675,7 @@ class LcdDisplay:
 
         # Erase old marker by restoring globe pixels (buffer only, no SPI)
         if old_bbox is not None:
-            x0, y0, x1, y1 = old_bbox
-            self._frame_buf_np[y0:y1 + 1, x0:x1 + 1] = self.frame_np_cache[frame_idx][y0:y1 + 1, x0:x1 + 1]
+            self._restore_globe_region(frame_idx, *old_bbox)
 
         # Draw new marker into buffer
         new_bbox = None
@@ -1398,21 +1693,39 @@ class LcdDisplay:
 
         self._prev_marker_bbox = new_bbox
 
-    def _save_preview(self, pixel_bytes: Union[bytes, bytearray]):
-        """Save an RGB565 frame buffer as a PNG preview image."""
+    def _queue_preview(self):
+        """Snapshot _frame_buf_np and hand it to the preview writer (non-blocking)."""
         try:
-            arr = np.frombuffer(pixel_bytes, dtype='>u2').reshape(self.height, self.width)
-            r = ((arr >> 11) & 0x1F).astype(np.uint8) * 8
-            g = ((arr >> 5) & 0x3F).astype(np.uint8) * 4
-            b = (arr & 0x1F).astype(np.uint8) * 8
-            rgb = np.stack([r, g, b], axis=-1)
-            img = Image.fromarray(rgb)
-            preview_path = self.settings.preview_dir / f"frame_{self._preview_frame_count:06d}.png"
+            self._preview_queue.put_nowait((self._frame_buf_np.copy(), self._preview_frame_count))
+        except queue.Full:
+            logger.debug("Preview writer busy, dropping frame %d", self._preview_frame_count)
+
+    def _preview_worker(self):
+        """Preview writer thread: encode queued frames to PNG until a None sentinel."""
+        while True:
+            item = self._preview_queue.get()
+            if item is None:
+                return
+            self._save_preview(*item)
+
+    def _save_preview(self, arr: np.ndarray, frame_count: int):
+        """Save a (height, width) big-endian RGB565 array as a PNG preview image."""
+        try:
+            img = Image.fromarray(_rgb565_to_rgb888_lut()[arr])
+            preview_path = self.settings.preview_dir / f"frame_{frame_count:06d}.png"
             img.save(preview_path)
             logger.debug(f"Preview saved: {preview_path}")
         except Exception as e:
             logger.warning(f"Failed to save preview: {e}")
 
     def close(self):
+        if self._preview_thread is not None:
+            # The sentinel queues behind any pending previews, so those still
+            # get written before the writer exits.
+            try:
+                self._preview_queue.put(None, timeout=5.0)
+                self._preview_thread.join(timeout=5.0)
+            except queue.Full:
+                logger.warning("Preview writer not draining; abandoning pending previews")
         if self.driver:
             self.driver.close()
@@ -0,0 +1,172 @@
+import dataclasses
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+from iss_display.display import lcd_driver
+from iss_display.display.lcd_driver import (
+    LcdDisplay, _rgb565_to_rgb888_lut, _rgb_to_rgb565, _rgb_to_rgb565_array)
+
+
+def _marker_display(width=320, height=480, hud_height=0):
+    """A hardware-free LcdDisplay carrying only the marker state and a frame buffer."""
+    lcd = object.__new__(LcdDisplay)
+    lcd.width, lcd.height = width, height
+    lcd._frame_buf_np = np.zeros((height, width), dtype='>u2')
+    lcd._hud_top_height = lcd._hud_bot_height = hud_height
+    lcd._init_marker()
+    return lcd
+
+
+def _cache_display(cache_dir, num_frames=3, width=8, height=6):
+    """A hardware-free LcdDisplay carrying only the frame-cache state."""
+    lcd = object.__new__(LcdDisplay)
+    lcd.width, lcd.height = width, height
+    lcd.num_frames = num_frames
+    lcd.globe_scale = 1.0
+    lcd.cache_dir = cache_dir
+    lcd.frame_np_cache = np.empty((0, height, width), dtype='>u2')
+    lcd.frames_generated = False
+
+    def no_generation():
+        raise AssertionError("frames must come from the legacy cache")
+
+    lcd._generate_frames = no_generation
+    return lcd
+
+
+def _write_legacy_cache(cache_dir, num_frames=3, width=8, height=6):
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, size=(num_frames, height, width, 3), dtype=np.uint8)
+    legacy = cache_dir / f"globe_{num_frames}f.npz"
+    np.savez(legacy, **{f"frame_{i}": frame for i, frame in enumerate(frames)})
+    return legacy, _rgb_to_rgb565_array(frames[..., 0], frames[..., 1], frames[..., 2])
+
+
+def _use_marker_theme(monkeypatch, **overrides):
+    theme = lcd_driver.THEME
+    marker = dataclasses.replace(theme.marker, **overrides)
+    monkeypatch.setattr(lcd_driver, "THEME", dataclasses.replace(theme, marker=marker))
+
+
+def test_rgb565_array_matches_scalar():
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, size=(64, 3), dtype=np.uint8)
+    packed = _rgb_to_rgb565_array(rgb[:, 0], rgb[:, 1], rgb[:, 2])
+    assert packed.dtype == np.uint16
+    assert packed.tolist() == [_rgb_to_rgb565(int(r), int(g), int(b)) for r, g, b in rgb]
+
+
+def test_rgb565_array_writes_big_endian_out():
+    rgb = np.array([[255, 0, 0], [0, 255, 0], [0, 0, 255], [18, 52, 86]], dtype=np.uint8)
+    out = np.empty(4, dtype='>u2')
+    result = _rgb_to_rgb565_array(rgb[:, 0], rgb[:, 1], rgb[:, 2], out=out)
+    assert result is out
+    assert out.tobytes() == b''.join(
+        _rgb_to_rgb565(int(r), int(g), int(b)).to_bytes(2, 'big') for r, g, b in rgb)
+
+
+def test_rgb888_lut_round_trips_and_spans_full_range():
+    lut = _rgb565_to_rgb888_lut()
+    values = np.arange(65536, dtype=np.uint16)
+    rgb = lut[values]
+    assert _rgb_to_rgb565_array(rgb[:, 0], rgb[:, 1], rgb[:, 2]).tolist() == values.tolist()
+    assert lut[0xFFFF].tolist() == [255, 255, 255]
+
+
+def test_ns_until_next_frame_lands_on_the_index_flip():
+    # Period deliberately not a multiple of num_frames, so boundaries
+    # fall between whole nanoseconds and the ceil division matters.
+    lcd = SimpleNamespace(_rotation_start_ns=123_456_789,
+                          _rotation_period_ns=60_000_000_007, num_frames=240)
+    rng = np.random.default_rng(0)
+    starts = rng.integers(-10**12, 10**12, size=500).tolist() + [lcd._rotation_start_ns]
+    for now in starts:
+        idx = LcdDisplay.rotation_frame_at(lcd, now)
+        wait = LcdDisplay.ns_until_next_frame(lcd, now)
+        assert wait > 0
+        assert LcdDisplay.rotation_frame_at(lcd, now + wait) == (idx + 1) % lcd.num_frames
+        assert LcdDisplay.rotation_frame_at(lcd, now + wait - 1) == idx
+
+
+def test_marker_sprite_accepts_float_theme_values(monkeypatch):
+    ints = dict(glow_color=(255, 0, 0), core_color=(200, 0, 0), center_color=(255, 255, 255),
+                ring_brightness_base=50, ring_brightness_step=40)
+    _use_marker_theme(monkeypatch, **ints)
+    expected = _marker_display()
+    _use_marker_theme(monkeypatch, **{
+        k: tuple(float(c) for c in v) if isinstance(v, tuple) else float(v)
+        for k, v in ints.items()})
+    lcd = _marker_display()
+    for level in (1, 16, lcd_driver._MARKER_OPACITY_LEVELS):
+        sprite, mask, r = lcd._marker_sprite(level)
+        want_sprite, want_mask, want_r = expected._marker_sprite(level)
+        assert r == want_r
+        assert np.array_equal(sprite, want_sprite)
+        assert np.array_equal(mask, want_mask)
+
+
+def test_disk_mask_matches_distance_test():
+    lcd = _marker_display()
+    for r in range(13):
+        d = np.arange(-r, r + 1)
+        expected = d[None, :] ** 2 + d[:, None] ** 2 <= r * r
+        assert np.array_equal(lcd._disk_mask(r), expected)
+
+
+def test_faded_marker_treats_black_sprite_pixels_as_transparent(monkeypatch):
+    # At the lowest opacity level a dim glow packs to RGB565 0; those
+    # pixels must leave the globe showing rather than paint a black halo.
+    _use_marker_theme(monkeypatch, glow_color=(50, 0, 0))
+    lcd = _marker_display()
+    sprite, mask, r = lcd._marker_sprite(1)
+    assert np.array_equal(mask, sprite != 0)
+    assert (lcd._disk_mask(r) & ~mask).any()
+
+    lcd._frame_buf_np[:] = 0x1234
+    x0, y0, x1, y1 = lcd._draw_iss_marker_rgb565(160, 240, 1 / lcd_driver._MARKER_OPACITY_LEVELS)
+    drawn = lcd._frame_buf_np[y0:y1 + 1, x0:x1 + 1]
+    assert not (drawn == 0).any()
+    assert np.array_equal(drawn[~mask], np.full((~mask).sum(), 0x1234))
+
+
+def test_marker_is_clipped_to_the_rows_between_hud_bars():
+    lcd = _marker_display(hud_height=40)
+    bottom = lcd.height - 40
+    x0, y0, x1, y1 = lcd._draw_iss_marker_rgb565(160, 42, 1.0)
+    assert y0 == 40
+    x0, y0, x1, y1 = lcd._draw_iss_marker_rgb565(160, bottom - 2, 1.0)
+    assert y1 == bottom - 1
+    assert not lcd._frame_buf_np[:40].any()
+    assert not lcd._frame_buf_np[bottom:].any()
+
+    assert lcd._draw_iss_marker_rgb565(160, 10, 1.0) is None
+    assert lcd._draw_iss_marker_rgb565(-50, 240, 1.0) is None
+    assert lcd._draw_iss_marker_rgb565(lcd.width + 50, 240, 1.0) is None
+
+
+def test_legacy_cache_is_converted_then_removed(tmp_path):
+    legacy, expected = _write_legacy_cache(tmp_path)
+    lcd = _cache_display(tmp_path)
+    lcd._load_or_generate_frames()
+
+    assert np.array_equal(lcd.frame_np_cache, expected)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["globe_3f_rgb565.npy"]
+    reloaded = np.load(tmp_path / "globe_3f_rgb565.npy")
+    assert reloaded.dtype == np.dtype('>u2')
+    assert np.array_equal(reloaded, expected)
+
+
+def test_legacy_cache_is_kept_when_saving_fails(tmp_path, monkeypatch):
+    legacy, expected = _write_legacy_cache(tmp_path)
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    lcd = _cache_display(tmp_path)
+    lcd._load_or_generate_frames()
+
+    assert np.array_equal(lcd.frame_np_cache, expected)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [legacy.name]